@@ -8,6 +8,8 @@ import pandas as pd
 import os
 from dotenv import load_dotenv
 
+from google_books.records import BOOK_FIELDS, BookRecord
+
 # load environment variables from .env file
 load_dotenv()
 
@@ -83,32 +85,11 @@ def fetch_books_data(target_count=10000):
     return books[:target_count]  # Return only up to the target count
 
 
-# Function to parse book data and convert it into a list of dictionaries
+# Function to parse book data and convert it into a list of compact book records
 def parse_books_data(data):
-    books = []
-    for item in data.get("items", []):
-        volume_info = item.get("volumeInfo", {})
-        book = {
-            "Title": volume_info.get("title", "N/A"),
-            "Authors": ", ".join(volume_info.get("authors", ["N/A"])),
-            "Publisher": volume_info.get("publisher", "N/A"),
-            "PublishedDate": volume_info.get("publishedDate", "N/A"),
-            "ISBN": next(
-                (
-                    identifier["identifier"]
-                    for identifier in volume_info.get("industryIdentifiers", [])
-                    if identifier["type"] == "ISBN_13"
-                ),
-                "N/A",
-            ),
-            "PageCount": volume_info.get("pageCount", "N/A"),
-            "Categories": ", ".join(volume_info.get("categories", ["N/A"])),
-            "AverageRating": volume_info.get("averageRating", "N/A"),
-            "RatingsCount": volume_info.get("ratingsCount", "N/A"),
-            "Language": volume_info.get("language", "N/A"),
-        }
-        books.append(book)
-    return books
+    return [
+        BookRecord.from_volume_info(item.get("volumeInfo", {})) for item in data.get("items", [])
+    ]
 
 
 # Fetch book data targeting books
@@ -117,7 +98,7 @@ books_list = fetch_books_data(10000)
 
 # Function to save books data to CSV
 def save_to_csv(books, filename="random_books_data_13.csv"):
-    df = pd.DataFrame(books)
+    df = pd.DataFrame.from_records([book.as_tuple() for book in books], columns=BOOK_FIELDS)
     df.to_csv(filename, index=False)
     print(f"Data saved to {filename}")
 
@@ -0,0 +1,358 @@
+import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+import logging
+import os
+import shutil
+import tempfile
+import time
+
+from dotenv import load_dotenv
+import pandas as pd
+import requests
+
+from google_books.records import MISSING, BookRecord
+
+# Set up logging to a file
+logging.basicConfig(
+    filename="refresh_google_books_data.log",
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+)
+
+# Load environment variables from .env file
+load_dotenv()
+
+# GET API KEY FROM .env file
+API_KEY = os.getenv("GOOGLE_BOOKS_API_KEY")
+
+if not API_KEY:
+    raise ValueError("API Key not found. Please set it in your .env file.")
+
+# Fields that change after a book is harvested and are worth re-fetching,
+# mapped to their ``volumeInfo`` keys
+VOLATILE_FIELDS = {"AverageRating": "averageRating", "RatingsCount": "ratingsCount"}
+
+# Bookkeeping columns added to the store by the refresh
+LAST_REFRESHED = "LastRefreshed"
+LAST_ATTEMPTED = "LastAttempted"
+RATINGS_CHANGES = "RatingsChanges"
+
+# Age in days given to books that have never been refreshed
+NEVER_REFRESHED_AGE = 365.0
+
+# Seconds to wait for the API before giving up on a single book
+REQUEST_TIMEOUT = 30
+
+
+class RateLimitError(Exception):
+    """Raised when the Google Books API answers with HTTP 429."""
+
+
+def load_store(store_path):
+    """
+    Load the books store, adding the refresh bookkeeping columns if missing.
+
+    Every column is read as a string so that ISBNs and "N/A" placeholders are
+    written back exactly as they were harvested.
+
+    Args:
+        store_path (str): Path to the books CSV.
+
+    Returns:
+        pd.DataFrame: The books store.
+    """
+    store = pd.read_csv(store_path, dtype=str, keep_default_na=False)
+    if LAST_REFRESHED not in store.columns:
+        store[LAST_REFRESHED] = ""
+    if LAST_ATTEMPTED not in store.columns:
+        store[LAST_ATTEMPTED] = store[LAST_REFRESHED]
+    if RATINGS_CHANGES not in store.columns:
+        store[RATINGS_CHANGES] = "0"
+    return store
+
+
+def staleness_priority(store, now):
+    """
+    Score each book by how stale and how volatile its ratings are.
+
+    The score is the number of days since the last refresh attempt, scaled up
+    by the number of times the ratings have changed on previous refreshes, so
+    books whose ratings move often are re-fetched sooner. Attempts that found
+    nothing still count, so unresolvable ISBNs drop down the queue.
+
+    Args:
+        store (pd.DataFrame): The books store.
+        now (datetime): The current time (timezone aware).
+
+    Returns:
+        pd.Series: Priority per row; higher means refresh sooner.
+    """
+    last_attempted = pd.to_datetime(store[LAST_ATTEMPTED], errors="coerce", utc=True)
+    age_days = ((now - last_attempted).dt.total_seconds() / 86400).fillna(NEVER_REFRESHED_AGE)
+    changes = pd.to_numeric(store[RATINGS_CHANGES], errors="coerce").fillna(0)
+    return age_days * (1 + changes)
+
+
+def select_stale_books(store, refresh_count, now):
+    """
+    Pick the row labels of the books most in need of a refresh.
+
+    Books without an ISBN-13 are skipped since they cannot be looked up again.
+
+    Args:
+        store (pd.DataFrame): The books store.
+        refresh_count (int): Maximum number of books to refresh.
+        now (datetime): The current time (timezone aware).
+
+    Returns:
+        list: Row labels ordered from most to least stale.
+    """
+    priority = staleness_priority(store, now)[store["ISBN"].ne(MISSING) & store["ISBN"].ne("")]
+    return list(priority.sort_values(ascending=False, kind="stable").index[:refresh_count])
+
+
+def fetch_volume_info(isbn):
+    """
+    Fetch the ``volumeInfo`` of a single book with an ``isbn:`` query.
+
+    Args:
+        isbn (str): The ISBN-13 of the book.
+
+    Returns:
+        dict or None: The ``volumeInfo`` whose ISBN-13 matches, or None if no item does.
+
+    Raises:
+        RateLimitError: If the API rate limit was hit.
+    """
+    url = f"https://www.googleapis.com/books/v1/volumes?q=isbn:{isbn}&key={API_KEY}"
+    try:
+        response = requests.get(url, timeout=REQUEST_TIMEOUT)
+    except requests.RequestException as error:
+        logging.error(f"Failed to fetch ISBN {isbn}: {error}")
+        return None
+
+    if response.status_code == 429:
+        raise RateLimitError(isbn)
+    if response.status_code != 200:
+        logging.error(f"Failed to fetch ISBN {isbn}: {response.status_code}")
+        return None
+
+    # Only accept the item whose ISBN-13 matches; the query can return near
+    # matches whose ratings belong to a different book
+    for item in response.json().get("items", []):
+        volume_info = item.get("volumeInfo", {})
+        if BookRecord.from_volume_info(volume_info).ISBN == isbn:
+            return volume_info
+    logging.warning(f"ISBN {isbn} not found")
+    return None
+
+
+def fetch_batch(isbns, max_workers=8):
+    """
+    Fetch a batch of books concurrently.
+
+    On a rate limit the requests that have not started yet are cancelled, and
+    the books already fetched are still returned so they can be upserted.
+
+    Args:
+        isbns (list): ISBN-13s to look up.
+        max_workers (int): Number of concurrent requests.
+
+    Returns:
+        tuple: A dict mapping every ISBN whose lookup completed to its
+            ``volumeInfo`` (None if not found), and a bool that is True if the
+            rate limit was hit.
+    """
+    volume_infos = {}
+    rate_limited = False
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(fetch_volume_info, isbn): isbn for isbn in isbns}
+        for future in as_completed(futures):
+            try:
+                volume_infos[futures[future]] = future.result()
+            except RateLimitError:
+                rate_limited = True
+                executor.shutdown(wait=True, cancel_futures=True)
+                break
+        if rate_limited:
+            # Keep the requests that were already in flight when the limit hit
+            for future, isbn in futures.items():
+                if future.done() and not future.cancelled() and future.exception() is None:
+                    volume_infos[isbn] = future.result()
+    return volume_infos, rate_limited
+
+
+def _normalize(value):
+    """
+    Normalize a rating value so CSV strings compare equal to API numbers.
+    """
+    if value in ("", MISSING, None):
+        return MISSING
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return str(value)
+
+
+def upsert_volatile_fields(store, row, volume_info, refreshed_at):
+    """
+    Update the volatile fields of one book in place.
+
+    Fields the API leaves out of ``volume_info`` are skipped rather than reset
+    to "N/A", so a response without ratings never erases harvested ones.
+
+    Args:
+        store (pd.DataFrame): The books store.
+        row: Row label of the book in the store.
+        volume_info (dict): The freshly fetched ``volumeInfo``.
+        refreshed_at (str): ISO timestamp of the refresh.
+
+    Returns:
+        list: One change-log entry per field whose value changed.
+    """
+    changes = []
+    for field, api_key in VOLATILE_FIELDS.items():
+        if api_key not in volume_info:
+            continue
+        old_value = store.at[row, field]
+        new_value = volume_info[api_key]
+        if _normalize(old_value) != _normalize(new_value):
+            store.at[row, field] = str(new_value)
+            changes.append(
+                {
+                    "RefreshedAt": refreshed_at,
+                    "ISBN": store.at[row, "ISBN"],
+                    "Field": field,
+                    "OldValue": old_value,
+                    "NewValue": str(new_value),
+                }
+            )
+    if changes:
+        store.at[row, RATINGS_CHANGES] = str(int(store.at[row, RATINGS_CHANGES] or 0) + 1)
+    store.at[row, LAST_REFRESHED] = refreshed_at
+    return changes
+
+
+def save_store(store, store_path):
+    """
+    Write the books store atomically so an interrupted write cannot truncate it.
+
+    The store is written to a temporary file in the same directory and then
+    moved over the original with ``os.replace``, keeping the original's
+    permissions.
+
+    Args:
+        store (pd.DataFrame): The books store.
+        store_path (str): Path to the books CSV.
+    """
+    directory = os.path.dirname(os.path.abspath(store_path))
+    fd, temp_path = tempfile.mkstemp(suffix=".csv", dir=directory)
+    try:
+        with os.fdopen(fd, "w", newline="") as temp_file:
+            store.to_csv(temp_file, index=False)
+        if os.path.exists(store_path):
+            shutil.copymode(store_path, temp_path)
+        os.replace(temp_path, store_path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def append_change_log(changes, changelog_path):
+    """
+    Append change-log entries to a CSV, writing the header on first use.
+
+    Args:
+        changes (list): Change-log entries as dictionaries.
+        changelog_path (str): Path to the change-log CSV.
+    """
+    if not changes:
+        return
+    write_header = not os.path.exists(changelog_path)
+    pd.DataFrame(changes).to_csv(changelog_path, mode="a", header=write_header, index=False)
+
+
+def refresh_books_data(
+    store_path, changelog_path=None, refresh_count=400, batch_size=40, max_workers=8
+):
+    """
+    Re-fetch the stalest books in the store and upsert their ratings in place.
+
+    Books are re-fetched in batches. The store is written once when the run
+    ends, including when it stops early on a rate limit or Ctrl+C, and the
+    change log is appended only after that write succeeds so it never records
+    changes the store does not have.
+
+    Args:
+        store_path (str): Path to the books CSV to refresh.
+        changelog_path (str): Path to the change-log CSV. Defaults to a
+            ``_changelog.csv`` file next to the store.
+        refresh_count (int): Maximum number of books to refresh.
+        batch_size (int): Number of books fetched per batch.
+        max_workers (int): Number of concurrent requests per batch.
+
+    Returns:
+        int: The number of books whose ratings changed.
+    """
+    if changelog_path is None:
+        changelog_path = os.path.splitext(store_path)[0] + "_changelog.csv"
+
+    store = load_store(store_path)
+    rows = select_stale_books(store, refresh_count, datetime.now(timezone.utc))
+    logging.info(f"Refreshing {len(rows)} of {len(store)} books in {store_path}")
+
+    changed_books = 0
+    changes = []
+    try:
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start : start + batch_size]
+            isbns = [store.at[row, "ISBN"] for row in batch]
+            volume_infos, rate_limited = fetch_batch(isbns, max_workers)
+
+            refreshed_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+            for row, isbn in zip(batch, isbns):
+                if isbn not in volume_infos:
+                    continue  # Cancelled or rate limited; not attempted
+                store.at[row, LAST_ATTEMPTED] = refreshed_at
+                if volume_infos[isbn] is not None:
+                    book_changes = upsert_volatile_fields(
+                        store, row, volume_infos[isbn], refreshed_at
+                    )
+                    changed_books += bool(book_changes)
+                    changes.extend(book_changes)
+
+            if rate_limited:
+                logging.error("Rate limit hit. Saving refreshed data and exiting.")
+                break
+            print(f"Refreshed {start + len(batch)} books so far, {changed_books} changed.")
+            time.sleep(1)  # To avoid hitting the rate limit
+    finally:
+        save_store(store, store_path)
+        logging.info(f"Store saved to {store_path}")
+        append_change_log(changes, changelog_path)
+
+    logging.info(f"Refresh finished: {changed_books} books changed.")
+    return changed_books
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Refresh the ratings of the stalest books in a harvested books CSV."
+    )
+    parser.add_argument("store_path", help="Books CSV to refresh in place.")
+    parser.add_argument("--changelog-path", help="Change-log CSV (default: next to the store).")
+    parser.add_argument("--refresh-count", type=int, default=400)
+    parser.add_argument("--batch-size", type=int, default=40)
+    parser.add_argument("--max-workers", type=int, default=8)
+    args = parser.parse_args()
+
+    logging.info("Script started.")
+    refresh_books_data(
+        args.store_path,
+        changelog_path=args.changelog_path,
+        refresh_count=args.refresh_count,
+        batch_size=args.batch_size,
+        max_workers=args.max_workers,
+    )
+    logging.info("Script finished successfully.")
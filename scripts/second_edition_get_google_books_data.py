@@ -6,6 +6,8 @@ import pandas as pd
 from dotenv import load_dotenv
 import logging
 
+from google_books.records import BOOK_FIELDS, BookRecord
+
 # Set up logging to a file
 logging.basicConfig(
     filename="get_google_books_data.log",
@@ -51,7 +53,7 @@ def fetch_books_data(target_count=10000):
         target_count (int): The target number of books to fetch.
 
     Returns:
-        list: A list of dictionaries containing book data.
+        list: A list of BookRecord objects containing book data.
     """
     books = []
     max_per_request = 40  # Maximum allowed by Google Books API
@@ -72,29 +74,7 @@ def fetch_books_data(target_count=10000):
                     break  # No more items available for this query
 
                 for item in data["items"]:
-                    volume_info = item["volumeInfo"]
-                    book = {
-                        "Title": volume_info.get("title", "N/A"),
-                        "Authors": ", ".join(volume_info.get("authors", ["N/A"])),
-                        "Publisher": volume_info.get("publisher", "N/A"),
-                        "PublishedDate": volume_info.get("publishedDate", "N/A"),
-                        "ISBN": next(
-                            (
-                                identifier["identifier"]
-                                for identifier in volume_info.get(
-                                    "industryIdentifiers", []
-                                )
-                                if identifier["type"] == "ISBN_13"
-                            ),
-                            "N/A",
-                        ),
-                        "PageCount": volume_info.get("pageCount", "N/A"),
-                        "Categories": ", ".join(volume_info.get("categories", ["N/A"])),
-                        "AverageRating": volume_info.get("averageRating", "N/A"),
-                        "RatingsCount": volume_info.get("ratingsCount", "N/A"),
-                        "Language": volume_info.get("language", "N/A"),
-                    }
-                    books.append(book)
+                    books.append(BookRecord.from_volume_info(item["volumeInfo"]))
                 start_index += max_per_request
                 time.sleep(1)  # To avoid hitting the rate limit
             elif response.status_code == 429:
@@ -142,7 +122,7 @@ def save_to_csv(
     Save books data to a CSV file.
 
     Args:
-        books (list): A list of dictionaries containing book data.
+        books (list): A list of BookRecord objects containing book data.
         directory (str): The directory where the file will be saved.
         base_filename (str): The base name of the file.
         extension (str): The file extension.
@@ -152,7 +132,7 @@ def save_to_csv(
 
     filename = get_next_filename(directory, base_filename, extension)
     filepath = os.path.join(directory, filename)
-    df = pd.DataFrame(books)
+    df = pd.DataFrame.from_records([book.as_tuple() for book in books], columns=BOOK_FIELDS)
     df.to_csv(filepath, index=False)
     logging.info(f"Data saved to {filepath}")
     print(f"Data saved to {filepath}")